@@ -0,0 +1,12 @@
+import pytest
+from tracing_bug_bash.app import memory_exporter
+
+@pytest.fixture(autouse=True)
+def _isolate_spans():
+    """
+    Start and end every test with an empty memory_exporter, so spans from
+    one test never leak into the next.
+    """
+    memory_exporter.clear()
+    yield
+    memory_exporter.clear()
@@ -1,7 +1,12 @@
+"""
+Tests for the tracing app.
+
+All tests share the module-level memory_exporter from tracing_bug_bash.app.
+The autouse fixture in conftest.py clears it around every test.
+"""
 import pytest
 from fastapi.testclient import TestClient
-import time
-from tracing_bug_bash.app import app, memory_exporter
+from tracing_bug_bash.app import app, memory_exporter, provider
 
 client = TestClient(app)
 
@@ -20,8 +25,8 @@ def test_spans_collection():
     response = client.get("/")
     assert response.status_code == 200
     
-    # Give the spans some time to be processed
-    time.sleep(0.1)
+    # Flush the spans queued by the span processor
+    provider.force_flush()
     
     # Check spans endpoint
     spans_response = client.get("/spans")
@@ -1,14 +1,16 @@
 import os
+import asyncio
+import contextvars
 from fastapi import FastAPI, Request, HTTPException, Depends, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
-import requests
-import time
+import httpx
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Optional, Any
 
 # OpenTelemetry imports
 from opentelemetry import trace
+from opentelemetry.trace import SpanKind
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import (
     ConsoleSpanExporter,
@@ -24,27 +26,61 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
-app = FastAPI(title="VectorBench Tracing App")
+app = FastAPI(title="VectorBench Tracing App", default_response_class=ORJSONResponse)
 
 # Initialize in-memory span exporter for testing
 memory_exporter = InMemorySpanExporter()
 
 # BUG 1: Missing span export configuration
 # The tracer provider is created but no exporter is attached
-# This should be fixed by adding SimpleSpanProcessor with memory_exporter
+# This should be fixed by adding a BatchSpanProcessor with memory_exporter
+# (spans are exported on a background thread, off the request path)
 provider = TracerProvider()
 trace.set_tracer_provider(provider)
-# MISSING: provider.add_span_processor(SimpleSpanProcessor(memory_exporter))
+# MISSING: provider.add_span_processor(BatchSpanProcessor(memory_exporter, schedule_delay_millis=50))
 
 # Get a tracer from the global TracerProvider
 tracer = trace.get_tracer(__name__)
 
+# W3C trace context propagator, shared across requests
+propagator = TraceContextTextMapPropagator()
+
 # Initialize FastAPI instrumentation
 FastAPIInstrumentor.instrument_app(app)
 
 # In-memory storage for collected spans (used for testing)
 collected_spans = []
 
+# Precomputed span kind names for /spans serialization
+SPAN_KIND_NAMES = {kind: str(kind) for kind in SpanKind}
+
+# Client for downstream calls, reused across requests
+downstream_client: Optional[httpx.AsyncClient] = None
+
+def get_downstream_client() -> httpx.AsyncClient:
+    """Return the shared downstream client, creating it if needed"""
+    global downstream_client
+    if downstream_client is None or downstream_client.is_closed:
+        # The echo service is served in-process through the ASGI transport,
+        # so no server has to be listening on port 8000
+        downstream_client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://localhost:8000",
+            timeout=10.0
+        )
+    return downstream_client
+
+@app.on_event("startup")
+async def open_downstream_client():
+    get_downstream_client()
+
+@app.on_event("shutdown")
+async def close_downstream_client():
+    global downstream_client
+    if downstream_client is not None:
+        await downstream_client.aclose()
+        downstream_client = None
+
 @app.get("/")
 async def root():
     """Root endpoint that returns a welcome message"""
@@ -61,9 +97,6 @@ async def error_endpoint():
     with tracer.start_as_current_span("error_endpoint") as span:
         span.set_attribute("endpoint", "error")
         
-        # Simulate some processing
-        time.sleep(0.1)
-        
         # BUG: This always raises an error
         # Should be fixed to return a normal response
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -85,13 +118,18 @@ async def call_downstream():
         # The headers should contain the trace context
         headers = {
             "Content-Type": "application/json",
-            # MISSING: TraceContextTextMapPropagator().inject(headers)
+            # MISSING: propagator.inject(headers)
         }
         
         # Call the echo endpoint which simulates a downstream service
-        response = requests.get(
-            f"http://localhost:8000/echo/{current_context.trace_id:032x}",
-            headers=headers
+        # It runs in-process, so it gets a fresh, empty context like a real
+        # remote service would: only the request headers can carry the trace
+        response = await asyncio.create_task(
+            get_downstream_client().get(
+                f"/echo/{current_context.trace_id:032x}",
+                headers=headers
+            ),
+            context=contextvars.Context()
         )
         
         return {"downstream_response": response.json()}
@@ -120,22 +158,24 @@ async def get_spans():
     This is used in testing to verify tracing is working
     """
     # BUG: We can't get the spans because we never attached the exporter
+    # Flush any spans still queued in the batch processor before reading them
+    provider.force_flush(timeout_millis=500)
     spans = memory_exporter.get_finished_spans()
     memory_exporter.clear()
     
     # Convert spans to a simple dictionary for JSON serialization
-    simplified_spans = []
-    for span in spans:
-        span_dict = {
+    simplified_spans = [
+        {
             "name": span.name,
-            "trace_id": f"{span.context.trace_id:032x}",
-            "span_id": f"{span.context.span_id:016x}",
-            "parent_id": f"{span.parent.span_id:016x}" if span.parent else None,
+            "trace_id": format(span.context.trace_id, "032x"),
+            "span_id": format(span.context.span_id, "016x"),
+            "parent_id": format(span.parent.span_id, "016x") if span.parent else None,
             "attributes": dict(span.attributes),
             "status": str(span.status),
-            "kind": str(span.kind),
+            "kind": SPAN_KIND_NAMES[span.kind],
         }
-        simplified_spans.append(span_dict)
+        for span in spans
+    ]
     
     return {"spans": simplified_spans}
 